@@ -15,7 +15,7 @@ ROS extensions, behaviours and utilities for py_trees.
 ##############################################################################
 
 from . import action_clients
-from . import actions  # to be deprecated in 2.1.x or later
+from . import actions  # deprecated, to be removed in 2.1.x or later
 from . import battery
 from . import blackboard
 from . import conversions
@@ -16,6 +16,8 @@ Behaviours for ROS actions.
 # Imports
 ##############################################################################
 
+import warnings
+
 from . import action_clients
 
 ##############################################################################
@@ -23,5 +25,16 @@ from . import action_clients
 ##############################################################################
 
 
-# to be deprecated in 2.1.x or later
-ActionClient = action_clients.FromConstant
+# to be removed in 2.1.x or later
+class ActionClient(action_clients.FromConstant):
+    """
+    .. deprecated:: 2.0.8
+        Use :class:`py_trees_ros.action_clients.FromConstant` instead.
+    """
+    def __init__(self, *args, **kwargs):
+        warnings.warn(
+            "py_trees_ros.actions.ActionClient is deprecated, use py_trees_ros.action_clients.FromConstant",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        super().__init__(*args, **kwargs)
@@ -84,9 +84,10 @@ class ToBlackboard(subscribers.ToBlackboard):
             if self.blackboard.battery.percentage > self.threshold + 5.0:
                 self.blackboard.battery_low_warning = False
             elif self.blackboard.battery.percentage < self.threshold:
+                    # only log on the transition, not every tick
+                    if not self.blackboard.battery_low_warning:
+                        self.node.get_logger().error("{}: battery level is low!".format(self.name))
                     self.blackboard.battery_low_warning = True
-                    # TODO: make this throttled
-                    self.node.get_logger().error("{}: battery level is low!".format(self.name))
             # else don't do anything in between - i.e. avoid the ping pong problems
 
             self.feedback_message = "Battery level is low" if self.blackboard.battery_low_warning else "Battery level is ok"
@@ -30,8 +30,6 @@ import os
 import py_trees.console as console
 import py_trees_ros.utilities
 import rclpy
-import ros2topic.api
-import ros2cli.node.strategy
 import sys
 import time
 
@@ -95,6 +93,9 @@ def command_line_argument_parser():
 
 
 def create_subscription(node, latched, topic_name, message_type, callback):
+    # deferred, so importing py_trees_ros doesn't drag in the ros2cli machinery
+    import ros2topic.api
+
     if message_type is None:
 
         for unused_i in range(0, 10):
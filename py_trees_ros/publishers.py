@@ -119,16 +119,16 @@ class FromBlackboard(py_trees.behaviour.Behaviour):
         """
         self.logger.debug("%s.update()" % self.__class__.__name__)
         try:
-            if isinstance(self.blackboard.get(self.blackboard_variable), self.topic_type):
-                self.publisher.publish(self.blackboard.get(self.blackboard_variable))
-            else:
-                raise TypeError("{} is not the required type [{}][{}]".format(
-                    self.blackboard_variable,
-                    self.topic_type,
-                    type(self.blackboard.get(self.blackboard_variable)))
-                )
-            self.feedback_message = "published"
-            return py_trees.common.Status.SUCCESS
+            msg = self.blackboard.get(self.blackboard_variable)
         except KeyError:
             self.feedback_message = "nothing to publish"
             return py_trees.common.Status.FAILURE
+        if not isinstance(msg, self.topic_type):
+            raise TypeError("{} is not the required type [{}][{}]".format(
+                self.blackboard_variable,
+                self.topic_type,
+                type(msg))
+            )
+        self.publisher.publish(msg)
+        self.feedback_message = "published"
+        return py_trees.common.Status.SUCCESS
@@ -201,6 +201,7 @@ class CheckData(Handler):
         self.variable_name = variable_name
         self.expected_value = expected_value
         self.comparison_operator = comparison_operator
+        self.check_attr = operator.attrgetter(self.variable_name)
         self.fail_if_no_data = fail_if_no_data
         self.fail_if_bad_comparison = fail_if_bad_comparison
 
@@ -218,9 +219,8 @@ class CheckData(Handler):
             self.feedback_message = "have not yet received any messages"
             return py_trees.common.Status.FAILURE if self.fail_if_no_data else py_trees.common.Status.RUNNING
 
-        check_attr = operator.attrgetter(self.variable_name)
         try:
-            value = check_attr(msg)
+            value = self.check_attr(msg)
         except AttributeError:
             self.node.get_logger().error("Behaviour [{}]: variable name not found [{}]".format(self.name, self.variable_name))
             print("{}".format(msg))
@@ -421,7 +421,7 @@ class ToBlackboard(Handler):
                         value = copy.copy(self.msg)
                         for field in fields:
                             value = getattr(value, field)
-                            self.blackboard.set(k, value, overwrite=True)
+                        self.blackboard.set(k, value, overwrite=True)
                 self.feedback_message = "saved incoming message"
                 # this is of dubious worth, since the default setting of ClearingPolicy.ON_INITIALISE
                 # covers every use case that we can think of.
@@ -260,9 +260,9 @@ class BehaviourTree(py_trees.trees.BehaviourTree):
 
         self.statistics = None
         self.tick_start_time = None
-        self.time_series = collections.deque([])
-        self.tick_interval_series = collections.deque([])
-        self.tick_duration_series = collections.deque([])
+        self.time_series = collections.deque(maxlen=10)
+        self.tick_interval_series = collections.deque(maxlen=10)
+        self.tick_duration_series = collections.deque(maxlen=10)
 
         self.pre_tick_handlers.append(self._statistics_pre_tick_handler)
         self.post_tick_handlers.append(self._statistics_post_tick_handler)
@@ -588,10 +588,6 @@ class BehaviourTree(py_trees.trees.BehaviourTree):
         Args:
             tree (:class:`~py_trees.trees.BehaviourTree`): the behaviour tree that has just been ticked
         """
-        if len(self.time_series) == 10:
-            self.time_series.popleft()
-            self.tick_interval_series.popleft()
-
         rclpy_start_time = rclpy.clock.Clock().now()
         self.time_series.append(conversions.rclpy_time_to_float(rclpy_start_time))
         if len(self.time_series) == 1:
@@ -599,18 +595,21 @@ class BehaviourTree(py_trees.trees.BehaviourTree):
         else:
             self.tick_interval_series.append(self.time_series[-1] - self.time_series[-2])
 
-        self.statistics = py_trees_msgs.Statistics()
-        self.statistics.count = self.count
-        self.statistics.stamp = rclpy_start_time.to_msg()
-        self.statistics.tick_interval = self.tick_interval_series[-1]
-        self.statistics.tick_interval_average = sum(self.tick_interval_series) / len(self.tick_interval_series)
+        tick_interval_average = sum(self.tick_interval_series) / len(self.tick_interval_series)
         if len(self.tick_interval_series) > 1:
-            self.statistics.tick_interval_variance = statistics.variance(
+            tick_interval_variance = statistics.variance(
                 self.tick_interval_series,
-                self.statistics.tick_interval_average
+                tick_interval_average
             )
         else:
-            self.statistics.tick_interval_variance = 0.0
+            tick_interval_variance = 0.0
+        self.statistics = py_trees_msgs.Statistics(
+            count=self.count,
+            stamp=rclpy_start_time.to_msg(),
+            tick_interval=self.tick_interval_series[-1],
+            tick_interval_average=tick_interval_average,
+            tick_interval_variance=tick_interval_variance
+        )
 
     def _statistics_post_tick_handler(self, tree: py_trees.trees.BehaviourTree):
         """
@@ -620,9 +619,6 @@ class BehaviourTree(py_trees.trees.BehaviourTree):
             tree (:class:`~py_trees.trees.BehaviourTree`): the behaviour tree that has just been ticked
         """
         duration = conversions.rclpy_time_to_float(rclpy.clock.Clock().now()) - self.time_series[-1]
-
-        if len(self.tick_duration_series) == 10:
-            self.tick_duration_series.popleft()
         self.tick_duration_series.append(duration)
 
         self.statistics.tick_duration = duration